@@ -4,6 +4,7 @@ Utilities for working with units of time and time series.
 
 from collections.abc import Iterator
 from datetime import date, timedelta
+from functools import lru_cache
 from itertools import islice
 from types import NoneType
 
@@ -36,13 +37,17 @@ def days_per_month(date_: date|int):
             month, year = date_.month, date_.year
         case _: # type: ignore
             raise ValueError(f'Invalid date: {date_}.')
-    days = DAYS_PER_MONTH[(month-1)%12]
-    if month == 2 and (year % 4) == 0:
-        # Leap year
-        days += 1
-    return days
+    # Add the leap day without branching on the month.
+    return DAYS_PER_MONTH[(month-1)%12] + (
+        month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0))
 
 
+_NEXT_MONTH_CACHE: tuple[date, date]|None = None
+'''
+The last `(today, next_month())` pair computed, as the default is
+constant for the whole month.
+'''
+
 def next_month(from_date: date|str|None=None) -> date:
     """
     The start of the next month from the given date, or today.
@@ -51,8 +56,17 @@ def next_month(from_date: date|str|None=None) -> date:
     date: date|datetime|str
         The date at the start of the next month.
     """
-    from_date = date.today() if from_date is None else parse_month(from_date)
-    from_date = from_date.replace(day=1)
+    global _NEXT_MONTH_CACHE
+    if from_date is None:
+        today = date.today()
+        cached = _NEXT_MONTH_CACHE
+        if cached is not None and cached[0] == today:
+            return cached[1]
+        from_date = today.replace(day=1)
+        result = from_date + timedelta(days=days_per_month(from_date))
+        _NEXT_MONTH_CACHE = (today, result)
+        return result
+    from_date = parse_month(from_date)
     return from_date + timedelta(days=days_per_month(from_date))
 
 
@@ -119,6 +133,21 @@ def months_str(start: date|str|NoneType=None,
             raise ValueError('Invalid end value.')
 
 
+@lru_cache(maxsize=256)
+def _parse_month_str(date_: str) -> date:
+    # `date` is immutable, so repeated month strings can share one.
+    date_ = date_.replace('-', '/').replace('.', '/')
+    year, month = date_.split('/')
+    year, month = int(year), int(month)
+    if month < 1 or month > 12:
+        raise ValueError(f'Invalid month: {month}.')
+    if year < 1900:
+        year += 2000
+    if year > 2200:
+        raise ValueError(f'Invalid year: {year}.')
+    return date(year, month, 1)
+
+
 def parse_month(date_: str|date|None=None) -> date:
     '''
     Parse a date string or date object into a month.
@@ -129,16 +158,7 @@ def parse_month(date_: str|date|None=None) -> date:
         case None:
             return next_month()
         case str():
-            date_ = date_.replace('-', '/').replace('.', '/')
-            year, month = date_.split('/')
-            year, month = int(year), int(month)
-            if month < 1 or month > 12:
-                raise ValueError(f'Invalid month: {month}.')
-            if year < 1900:
-                year += 2000
-            if year > 2200:
-                raise ValueError(f'Invalid year: {year}.')
-            return date(year, month, 1)
+            return _parse_month_str(date_)
         case date():
             return date_.replace(day=1)
         case _: # type: ignore
@@ -3,9 +3,10 @@ Decorators for the pplt package.
 '''
 
 from abc import abstractmethod
-from collections.abc import Callable, Iterator, Sequence
+from collections.abc import Callable, Sequence
 from datetime import date
-import re
+from functools import partial
+import sys
 from typing import Any, Protocol, TYPE_CHECKING, cast
 
 from rich.console import ConsoleRenderable, RenderableType, RichCast
@@ -88,12 +89,16 @@ class EventSpecifier(Protocol):
 class Wrapper(tl.UpdateHandler):
     '''
     A wrapper for the user-supplied function that adds metadata, including
-    scheduling information, and adapts it to the TimelineUpdateHandler protocol.
+    scheduling information, and adapts it to the UpdateHandler protocol.
     '''
 
+    # `__doc__` and `__module__` can't be slots (they conflict with the class
+    # attributes), so they live in the `__dict__` inherited from `UpdateHandler`.
+    __slots__ = ('start', 'period', 'fn', 'func', 'accounts', 'description',
+                 'tags', '__name__', '__qualname__')
+
     start: date
     period: Periodic|None
-    dates: Iterator[date]
     fn: Callable[..., Any]
     func: Callable[..., Any]
     accounts: RenderableType|list[RenderableType]
@@ -142,9 +147,11 @@ class Wrapper(tl.UpdateHandler):
 class EventWrapper(Wrapper):
     '''
     A wrapper for the user-supplied event function that adds metadata, including
-    scheduling information, and adapts it to the TimelineUpdateHandler protocol.
+    scheduling information, and adapts it to the UpdateHandler protocol.
     '''
 
+    __slots__ = ('account_name', 'args', '_bound')
+
     account_name: str
     args: dict[str, Any]
 
@@ -163,6 +170,7 @@ class EventWrapper(Wrapper):
                              **kwargs)
             self.account_name = account_name
             self.args = kwargs
+            self._bound = partial(func, **kwargs)
 
     def __call__(self, step: 'TimelineStep', /) -> None:
         '''
@@ -172,40 +180,55 @@ class EventWrapper(Wrapper):
         if date_ < self.start:
             # Too soon.
             return None
-        account = step.states[self.account_name]
-        value = step.values[self.account_name]
-        update = self.func(date_, value, **self.args)
-        match update:
-            case None:
-                pass
-            case str():
-                raise ValueError(f'Invalid update: {update} for event')
-            case _:
-                nbalence= account.send(float(update))
-                step.transactions.append((self.account_name, self, update, nbalence))
-
-RE_VAR_REF = re.compile(r'^\{(\w+)\}$')
+        name = self.account_name
+        account = step.states[name]
+        value = step.values[name]
+        update = self._bound(date_, value)
+        if update is None:
+            return None
+        # Plain numbers are the common case; check them first by exact class.
+        cls = update.__class__
+        if cls is not float and cls is not int and isinstance(update, str):
+            raise ValueError(f'Invalid update: {update} for event')
+        nbalence= account.send(float(update))
+        step.transactions.append((name, self, update, nbalence))
+
+def _var_ref(spec: str) -> str|None:
+    '''
+    The variable name if the spec is exactly of the form `'{var}'`, else `None`.
+    '''
+    if len(spec) > 2 and spec[0] == '{' and spec[-1] == '}':
+        var = spec[1:-1]
+        # Word characters only, as with the regex `\w+`.
+        if var.replace('_', 'a').isalnum():
+            return var
+    return None
+
 def format_cell(spec: str|list[str], /, *args: Any, **kwargs: Any,) -> RenderableType|list[RenderableType]:
     '''
     Format a cell in a table, replacing variables with values from the args.
 
     Handle rich text specially; it is not converted to a string if the spec is of the form `'{var}'`.
+
+    Formatted strings are interned, as many handlers share the same descriptions.
     '''
     if isinstance(spec, list):
         return [cast(RenderableType, format_cell(s, *args, **kwargs)) for s in spec]
-    match RE_VAR_REF.match(spec):
+    match _var_ref(spec):
         case None:
-            return spec.format(*args, **kwargs)
-        case m:
-            var = m.group(1)
+            return sys.intern(spec.format(*args, **kwargs))
+        case var:
             if var not in kwargs:
                 raise ValueError(f'Value not supplied: {var}. Variables: {", ".join(kwargs.keys()) or "None"}')
             val = kwargs[var]
             match val:
-                case ConsoleRenderable() | RichCast() | str():
+                case ConsoleRenderable() | RichCast():
                     return val
+                case str():
+                    # sys.intern() rejects str subclasses.
+                    return sys.intern(val) if type(val) is str else val
                 case _:
-                    return str(val)
+                    return sys.intern(str(val))
 
 def event(period: tuple[int, PeriodUnit]|None=None,
           description: str|list[str] = ''):
@@ -329,9 +352,14 @@ class TransactionSpecifier(Protocol):
 class TransactionWrapper(Wrapper):
     '''
     A wrapper for the user-supplied transaction function that adds metadata, including
-    scheduling information, and adapts it to the TimelineUpdateHandler protocol.
+    scheduling information, and adapts it to the UpdateHandler protocol.
+
+    The `amount` is expected to already be an `AccountValue`; `transaction()`
+    normalizes plain numbers before constructing the wrapper.
     '''
 
+    __slots__ = ('from_account', 'to_account', 'args', 'kwargs', '_bound')
+
     from_account: str
     to_account: str
     args: Any
@@ -350,7 +378,6 @@ class TransactionWrapper(Wrapper):
                     tags: list[str]|None = None,
                     **kwargs: Any) -> None:
         accounts = [from_account, '→ ', to_account]
-        amount = AccountValue(amount) if isinstance(amount, (float, int)) else amount
         super().__init__(func, fn, start, period, accounts, description,
                          from_account, to_account,
                          amount=amount,
@@ -360,6 +387,7 @@ class TransactionWrapper(Wrapper):
         self.to_account = to_account
         self.args = args
         self.kwargs = dict(amount=amount, **kwargs)
+        self._bound = partial(func, **self.kwargs)
 
     def __call__(self, step: 'TimelineStep', /) -> None:
         '''
@@ -369,15 +397,20 @@ class TransactionWrapper(Wrapper):
         if date_ < self.start:
             # Too soon.
             return None
-        from_account = step.states[self.from_account]
-        from_value = step.values[self.from_account]
-        to_account = step.states[self.to_account]
-        to_value = step.values[self.to_account]
-        update = self.func(date_, from_value, to_value, **self.kwargs)
+        from_name = self.from_account
+        to_name = self.to_account
+        states = step.states
+        values = step.values
+        from_account = states[from_name]
+        from_value = values[from_name]
+        to_account = states[to_name]
+        to_value = values[to_name]
+        update = self._bound(date_, from_value, to_value)
+        transactions = step.transactions
         nbalence = from_account.send(-update)
-        step.transactions.append((self.from_account, self, -update, nbalence))
+        transactions.append((from_name, self, -update, nbalence))
         nbalence = to_account.send(update)
-        step.transactions.append((self.to_account, self, update, nbalence))
+        transactions.append((to_name, self, update, nbalence))
 
 
 def parse_periodic(period: Period|Sequence[int|PeriodUnit]|str|None, start: date) -> Periodic|None:
@@ -456,7 +489,7 @@ def transaction(period: tuple[int, PeriodUnit]|None=None,
                         tags: list[str]|None = None,
                         **kwargs: Any) -> 'UpdateHandler':
             start = parse_month(start) if start else next_month()
-            if isinstance(amount, float):
+            if isinstance(amount, (float, int)):
                 amount = AccountValue(amount)
             return TransactionWrapper(func, for_accounts, start,
                                     parse_periodic(period or outer_period, start),
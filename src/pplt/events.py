@@ -19,4 +19,11 @@ def interest(date_: date, state: AccountValue, /,
 
     schedule.add(interest('MyAccount', '25/1', rate=0.01))
     """
-    return state * monthly_rate(rate / 100)
\ No newline at end of file
+    # Accounts that aren't open earn nothing, and keep their status.
+    if state.status != 'open':
+        return state
+    # Multiply as plain floats and box once, rather than going through
+    # AccountValue.__mul__'s operator dispatch every step.
+    currency = state.currency
+    amount = state.amount * monthly_rate(rate / 100) or 0.0
+    return AccountValue(round(amount, currency.decimal_digits), 'open', currency)
@@ -9,27 +9,68 @@ earn interest on the interest.
 '''
 
 from contextlib import suppress
-from datetime import datetime, date
+from datetime import date, datetime
+
+import numpy as np
 
 from pplt.dates import parse_month
 from pplt.period import PeriodUnit
 
+_APR_EXP: dict[PeriodUnit, float] = {
+    'day': 365.25,
+    'week': 365.25 / 7,
+    'month': 12,
+    'quarter': 4,
+    'year': 1,
+}
+'''
+The number of compounding periods per year for each `PeriodUnit`.
+'''
+
 def apr(rate: float, period: PeriodUnit):
-    match period:
-        case 'day':
-            exp = 365.25
-        case 'week':
-            exp = 365.25 / 7
-        case 'month':
-            exp = 12
-        case 'quarter':
-            exp = 4
-        case 'year':
-            return rate
-        case _: # type: ignore
-            raise ValueError(f"Invalid period unit: {period}")
+    try:
+        exp = _APR_EXP[period]
+    except KeyError:
+        raise ValueError(f"Invalid period unit: {period}") from None
+    if period == 'year':
+        # Already annual; avoid rounding through the power.
+        return rate
     return (1 + rate) ** exp - 1
 
+
+def _periodic_rate(rates: np.ndarray, exp: float) -> np.ndarray:
+    '''
+    Compound an array of rates over _exp_ periods.
+    '''
+    return np.power(1.0 + np.asarray(rates, dtype=np.float64), exp) - 1.0
+
+
+def apr_array(rates: np.ndarray, period: PeriodUnit) -> np.ndarray:
+    """
+    Vectorized `apr()` over an array of rates.
+    """
+    try:
+        exp = _APR_EXP[period]
+    except KeyError:
+        raise ValueError(f"Invalid period unit: {period}") from None
+    return _periodic_rate(rates, exp)
+
+
+def monthly_rate_array(annual: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `monthly_rate()` over an array of annual rates.
+    NOTE: not as percentage!
+    """
+    return _periodic_rate(annual, 1/12.0)
+
+
+def daily_rate_array(annual: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `daily_rate()` over an array of annual rates.
+    NOTE: not as percentage!
+    """
+    return _periodic_rate(annual, 1/365.25)
+
 def monthly_rate(annual: float):
     """
     Convert annual rate to monthly. This is NOT the same as dividing by 12.
@@ -109,7 +150,10 @@ def rate_of_return(start_date: date|str, start_value: float,
                 return date_
             case str():
                 with suppress(ValueError):
-                    return datetime.strptime(date_, "%Y-%m-%d")
+                    return date.fromisoformat(date_)
+                # Dates without zero-padding, e.g. 2021-1-5.
+                with suppress(ValueError):
+                    return datetime.strptime(date_, '%Y-%m-%d').date()
                 return parse_month(date_)
             case _: # type: ignore
                 raise ValueError(f"Invalid date: {date_}")
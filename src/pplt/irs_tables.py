@@ -3,19 +3,77 @@ Download the IRS tables from the IRS website and save them as a dictionary of pa
 '''
 
 
+from functools import cached_property
 from pathlib import Path
+from typing import Literal
+
+import numpy as np
 import pandas as pd
 
+IRS_DTYPES = {
+    'Rate': 'float64',
+    'Single': 'float64',
+    'Joint': 'float64',
+    'Household': 'float64',
+}
+'''
+The column types of the IRS rate tables, so the CSV parser can skip type inference.
+'''
+
+type FilingStatus = Literal['Single', 'Joint', 'Household']
+'''
+The filing statuses, which are the threshold columns of the IRS rate tables.
+'''
 
 class TaxTable:
     '''
     A tax lookup table, as from from the IRS.
+
+    The table is not read until it is first used.
     '''
     year: int
-    table: pd.DataFrame
+    file: Path
 
     def __init__(self, year: int, file: Path):
         self.year = year
-        self.table = pd.read_csv(file) # type: ignore
+        self.file = file
+
+    @cached_property
+    def table(self) -> pd.DataFrame:
+        return pd.read_csv(self.file, # type: ignore
+                           engine='c',
+                           memory_map=True,
+                           dtype=IRS_DTYPES)
+
+    @cached_property
+    def _brackets(self) -> pd.DataFrame:
+        # Thresholds ascend with the rate.
+        return self.table.sort_values('Rate')
+
+    @cached_property
+    def _rates(self) -> np.ndarray:
+        return self._brackets['Rate'].to_numpy(dtype=np.float64)
+
+    @cached_property
+    def _thresholds(self) -> dict[str, np.ndarray]:
+        table = self._brackets
+        return {
+            status: np.ascontiguousarray(table[status].to_numpy(dtype=np.float64))
+            for status in ('Single', 'Joint', 'Household')
+        }
+
+    def lookup(self, income: float, status: FilingStatus='Single') -> float:
+        '''
+        The marginal tax rate for the given income, as a fraction.
+        '''
+        i = np.searchsorted(self._thresholds[status], income, side='right') - 1
+        return float(self._rates[max(int(i), 0)])
+
+    def lookup_many(self, incomes: np.ndarray, status: FilingStatus='Single') -> np.ndarray:
+        '''
+        The marginal tax rates for an array of incomes, as fractions.
+        '''
+        i = np.searchsorted(self._thresholds[status], incomes, side='right') - 1
+        return self._rates[np.maximum(i, 0)]
 
-IRS_2024 = TaxTable(2024, Path(__file__).parent / 'data/IRS-rates-2024.csv')
\ No newline at end of file
+IRS_2024 = TaxTable(2024, Path(__file__).parent / 'data/IRS-rates-2024.csv')
@@ -12,6 +12,16 @@ Each type of entry in the YAML file is loaded by a loader function, which is
 registered in the `LOADERS` dictionary. The loader functions are added to the
 dictionary using the `add_loader` function.
 
+A scenario can build on others with entries of type `import`. Entries are
+matched up by ID (the `id` field, or else the `name`), and the file is read in a
+single pass. The precedence is:
+
+1. Fields from the importing file override fields of imported entries with the
+   same ID, whether they appear before or after the `import`.
+2. Between two imports, fields from the earlier import win.
+
+Only top-level fields are overridden; sub-dictionaries are replaced whole.
+
 The loader functions receive a dictionary that corresponds to the YAML document,
 and return an object that can be used in the simulation. The type of the dictionary
 for each loader is defined in a `TypedDict` subclass. This documents what fields
@@ -29,13 +39,26 @@ to validate the values, and convert if necessary. For example,
 
 from collections.abc import Iterable
 from datetime import date
+from functools import lru_cache
 from itertools import count
 from pathlib import Path
-from typing import Literal, NotRequired, Protocol, TypedDict, cast
+from typing import Literal, NamedTuple, NotRequired, Protocol, TypedDict, cast
+import os
 import sys
 from inspect import signature
 
 import yaml
+try:
+    from yaml import CSafeLoader as _LOADER
+except ImportError:
+    if os.environ.get('PPLT_REQUIRE_LIBYAML'):
+        raise ImportError('PPLT_REQUIRE_LIBYAML is set, but PyYAML was built without libyaml') from None
+    from yaml import SafeLoader as _LOADER # type: ignore
+'''
+The YAML loader for scenario files: the libyaml-based `CSafeLoader` if available,
+else the pure-Python `SafeLoader`. Set `PPLT_REQUIRE_LIBYAML` in the environment
+to make the fallback an error.
+'''
 
 from pplt.account import Account, AccountValue, valid_account_status
 from pplt.currency import valid_currency
@@ -87,15 +110,52 @@ class Loader[T: str, L: Loadable](Protocol):
     def __call__(self, entry: LoaderEntry[T]) -> L:
         ...
 
-LOADERS: dict[str, Loader[str, Loadable]] = {}
+type LoaderKind = Literal['account', 'handler']
+'''
+What a loader produces: an `Account`, or an `UpdateHandler` for the schedule.
+'''
 
+class LoaderSpec(NamedTuple):
+    '''
+    A registered loader, with the keys its entries must and may have.
+    These are taken from the `TypedDict` annotation of the loader's parameter
+    when the loader is added.
+    '''
+    loader: Loader[str, Loadable]
+    required: frozenset[str]
+    optional: frozenset[str]
+    kind: LoaderKind
+
+LOADERS: dict[str, LoaderSpec] = {}
 
-def add_loader[T: str, L: Loadable](type_name: T, loader: Loader[T, L]):
+
+def add_loader[T: str, L: Loadable](type_name: T,
+                                    loader: Loader[T, L],
+                                    kind: LoaderKind|None=None):
     '''
     Add a loader to the `LOADERS` dictionary.
+
+    PARAMETERS
+    ----------
+    type_name: str
+        The `type` of the entries this loader handles.
+    loader: Loader
+        The loader function.
+    kind: LoaderKind
+        Whether the loader produces an account or a handler. If not given, it is
+        inferred from the loader's return annotation.
     '''
+    sig = signature(loader)
+    # Get the type of the first parameter of the loader function
+    p0 = cast(type, next(iter(sig.parameters.values())).annotation)
+    if kind is None:
+        ret = sig.return_annotation
+        kind = 'account' if isinstance(ret, type) and issubclass(ret, Account) else 'handler'
     # Complains if we cast as unnecessary (as is proper) but complains if we don't cast.
-    LOADERS[type_name] = loader # type: ignore
+    LOADERS[type_name] = LoaderSpec(loader, # type: ignore
+                                    frozenset(p0.__required_keys__), # type: ignore
+                                    frozenset(p0.__optional_keys__), # type: ignore
+                                    kind)
 
 
 class LoaderValue_(TypedDict):
@@ -114,11 +174,16 @@ def load_value(entry: LoaderValue|float|int) -> AccountValue:
     '''
     match entry:
         case float()|int():
-            return AccountValue(entry)
+            return _load_value_cached(entry, 'open', 'USD')
         case _:
-            status = valid_account_status(entry.get('status', 'open'))
-            currency = valid_currency(entry.get('currency', 'USD'))
-            return AccountValue(entry['amount'], status, currency)
+            return _load_value_cached(entry['amount'],
+                                      entry.get('status', 'open'),
+                                      entry.get('currency', 'USD'))
+
+@lru_cache(maxsize=256)
+def _load_value_cached(amount: float, status: str, currency: str) -> AccountValue:
+    # `AccountValue` is immutable, so equal entries can share one.
+    return AccountValue(amount, valid_account_status(status), valid_currency(currency))
 
 class LoaderPeriod(TypedDict):
     n: int
@@ -131,8 +196,11 @@ def load_period(entry: LoaderPeriod|None) -> Period|None:
     if entry is None:
         # Not periodic.
         return None
-    unit =  entry['unit']
-    return Period(unit, entry['n'])
+    return _load_period_cached(entry['unit'], entry['n'])
+
+@lru_cache(maxsize=256)
+def _load_period_cached(unit: PeriodUnit, n: int) -> Period:
+    return Period(unit, n)
 
 def load_periodic(entry: LoaderPeriod) -> Periodic:
     start = entry.get('start', None)
@@ -147,9 +215,11 @@ def load_rate(entry: LoaderRate) -> float:
     '''
     Load a rate (as a percentage) from a loader entry.
     '''
-    percent = entry['percent']
-    period = valid_period_unit(entry.get('period', 'year'))
-    return apr(percent / 100.0, period)
+    return _load_rate_cached(entry['percent'], entry.get('period', 'year'))
+
+@lru_cache(maxsize=256)
+def _load_rate_cached(percent: float, period: str) -> float:
+    return apr(percent / 100.0, valid_period_unit(period))
 
 class LoaderAccount(LoaderEntry[Literal['account']], LoaderValue_):
     name: str
@@ -225,12 +295,13 @@ add_loader('transfer', load_transfer) # type: ignore
 class LoaderImport(LoaderEntry[Literal['import']]):
     file: str
 
+_GENID_COUNTER = count()
+
 def genid():
     '''
     Generate a unique ID for an entry.
     '''
-    _counter = count()
-    return f'__{next(_counter)}'
+    return f'__{next(_GENID_COUNTER)}'
 
 def entry_id(entry: LoaderEntry[str]) -> str|int:
     '''
@@ -257,93 +328,111 @@ def valid_loader_entry(entry: LoaderEntry[str]|None) -> LoaderEntry[str]|None:
             return entry
         # Verify that it's a valid loader type
         case _:
-            if not type_ in LOADERS:
+            spec = LOADERS.get(type_)
+            if spec is None:
                 print(f'Unknown loader type: {type_}', file=sys.stderr)
                 return None
-    loader = LOADERS[type_]
-    # Get the type of the first parameter of the loader function
-    sig = signature(loader)
-    p0_name = list(sig.parameters)[0]
-    p0 = cast(type, sig.parameters[p0_name].annotation)
+    required, optional = spec.required, spec.optional
+    keys = entry.keys()
     # Check that the required keys are present
-    for k in p0.__required_keys__: # type: ignore
-        if k not in entry:
-            print(f'Missing required key {k} for {type_}', file=sys.stderr)
-            return None
+    for k in required - keys:
+        print(f'Missing required key {k} for {type_}', file=sys.stderr)
+        return None
     # Check that there are no unknown keys
-    for k in entry:
-        if k not in p0.__required_keys__ and k not in p0.__optional_keys__: # type: ignore
-            print(f'Unknown key {k} for {type_}', file=sys.stderr)
-            return None
+    for k in keys - required - optional:
+        print(f'Unknown key {k} for {type_}', file=sys.stderr)
+        return None
     return entry
 
+def _merge_import(by_id: dict[str|int, LoaderEntry[str]],
+                  path: Path,
+                  entry: LoaderImport):
+    '''
+    Merge the entries of an imported scenario into _by_id_. Fields of
+    entries already present take precedence over the imported ones.
+    '''
+    imported = load_scenario_yaml(path.parent / entry['file'])
+    for id_, entry_ in imported.items():
+        if id_ in by_id:
+            # An import overriding an entry from a prior import
+            entry_.update(by_id[id_])
+        by_id[id_] = entry_
+
+def _merge_entry(by_id: dict[str|int, LoaderEntry[str]],
+                 entry: LoaderEntry[str]):
+    '''
+    Merge a local entry into _by_id_, overriding the fields of any
+    imported entry with the same ID.
+    '''
+    id_ = entry['id']
+    if id_ in by_id:
+        # Overriding an imported entry
+        by_id[id_].update(entry)
+    else:
+        by_id[id_] = entry
+
 def load_scenario_yaml(path: Path|str) -> dict[str|int, LoaderEntry[str]]:
     '''
     Load the `LoaderEntry` objects from a YAML file, to be merged with
     imports of other scenarios.
 
-
-    '''
-    path = Path(path)
+    The documents are processed in order. Local
+    entries override the fields of imported entries with the same ID,
+    wherever the `import` appears in the file.
+
+    Parsed files are cached by resolved path and modification time, so a
+    file imported by several scenarios is parsed only once. Imports are merged
+    on each call, so edits to imported files are seen. Each call returns
+    fresh copies of the entries, which the caller may modify; sub-dictionaries
+    are shared, and should not be modified.
+    '''
+    path = Path(path).resolve()
+    by_id: dict[str|int, LoaderEntry[str]] = {}
+    for entry in _parse_scenario_yaml_cached(path, path.stat().st_mtime_ns):
+        if entry.get('type', None) == 'import':
+            _merge_import(by_id, path, cast(LoaderImport, entry))
+        else:
+            _merge_entry(by_id, cast(LoaderEntry[str], dict(entry)))
+    return by_id
+
+@lru_cache(maxsize=64)
+def _parse_scenario_yaml_cached(path: Path, mtime_ns: int) -> tuple[LoaderEntry[str], ...]:
+    '''
+    Parse the entries of a scenario file, without merging imports. The
+    modification time is only part of the cache key. The entries must not be
+    modified; `load_scenario_yaml` copies them.
+    '''
+    entries: list[LoaderEntry[str]] = []
     with path.open() as f:
-        by_id: dict[str|int, LoaderEntry[str]] = {}
-        # Load the entries from the YAML file
-        entries = cast(Iterable[LoaderEntry[str]], yaml.safe_load_all(f))
-
-        entries = sorted((e for e in entries if e),
-                         key=lambda entry: entry_id(entry))
-        for entry in entries:
-            match entry.get('type', None):
-                case 'import':
-                    entry_ = cast(LoaderImport, entry)
-                    file = entry_['file']
-                    imported = load_scenario_yaml(path.parent / file)
-                    for id_, entry_ in imported.items():
-                        if id_ in by_id:
-                            # An import overriding an entry from a prior import
-                            entry_.update(by_id[id_])
-                        by_id[id_] = entry_
-                case _:
-                    pass
-        for entry in entries:
-            match entry.get('type', None):
-                case 'import':
-                    pass
-                case _:
-                    id_ = entry_id(entry)
-                    if id_ in by_id:
-                        # Overriding an imported entry
-                        by_id[id_].update(entry)
-                    else:
-                        by_id[id_] = entry
-        return by_id
+        for entry in cast(Iterable[LoaderEntry[str]], yaml.load_all(f, Loader=_LOADER)):
+            if not entry:
+                continue
+            entry['id'] = entry_id(entry)
+            entries.append(entry)
+    return tuple(entries)
 
 def load_scenario(path: Path|str) -> Timeline:
     '''
     Load a scenario from a YAML file.
     '''
     by_id = load_scenario_yaml(path)
-    def load_item(entry: LoaderEntry[str]):
+    loaders_get = LOADERS.get
+    accounts: dict[str, Account] = {}
+    handlers: list[UpdateHandler] = []
+    # Load and partition the items in a single pass.
+    for entry in by_id.values():
         type_ = entry['type']
-        loader = LOADERS.get(type_)
-        if loader is None:
+        if type_ == 'import':
+            continue
+        spec = loaders_get(type_)
+        if spec is None:
             raise ValueError(f'Unknown loader type: {type_}')
-        return loader(entry)
-    items = [
-        load_item(entry)
-        for entry in by_id.values()
-        if entry['type'] != 'import'
-    ]
-    accounts = {
-        item.name: item
-        for item in items
-        if isinstance(item, Account)
-    }
-    handlers = [
-        item
-        for item in items
-        if isinstance(item, UpdateHandler)
-    ]
+        item = spec.loader(entry)
+        if spec.kind == 'account':
+            account = cast(Account, item)
+            accounts[account.name] = account
+        else:
+            handlers.append(cast(UpdateHandler, item))
     schedule = Schedule(handlers)
     return timeline(schedule, **accounts)
 
@@ -10,15 +10,17 @@ from pplt.dates import parse_month
 
 type PeriodUnit = Literal['day', 'week', 'month', 'quarter', 'year']
 
+_VALID_PERIOD_UNITS: frozenset[str] = frozenset(('day', 'week', 'month', 'quarter', 'year'))
+
 def valid_period_unit(unit: str) -> PeriodUnit:
     '''
     Validate a period unit.
     '''
-    if unit not in ('day', 'week', 'month', 'quarter', 'year'):
+    if unit not in _VALID_PERIOD_UNITS:
         raise ValueError(f'Invalid period unit: {unit}')
     return unit
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Period:
     '''
     A period of time, with a unit and a number of units.
@@ -33,10 +35,20 @@ class Periodic:
     '''
     A periodic event.
     '''
+    __slots__ = ('period', 'start', 'end', 'next', '_step_days', '_step_months')
+
     period: Period
     start: date
     end: date|None
     next: date
+    _step_days: int
+    '''
+    The step in days, for day and week periods; otherwise 0.
+    '''
+    _step_months: int
+    '''
+    The step in months, for month, quarter, and year periods; otherwise 0.
+    '''
 
     @property
     def n(self):
@@ -48,31 +60,61 @@ class Periodic:
 
     def __init__(self, start: date, n: int, unit: PeriodUnit, end: date|None=None):
         self.period = Period(unit, n)
-        self.start = parse_month(start)
-        self.next = self.start
-        self.end = parse_month(end) if end else None
+        # Dates that are already the start of a month need no parsing.
+        if type(start) is not date or start.day != 1:
+            start = parse_month(start)
+        self.start = start
+        self.next = start
+        if end and (type(end) is not date or end.day != 1):
+            end = parse_month(end)
+        self.end = end or None
+        self._step_days = {'day': n, 'week': 7 * n}.get(unit, 0)
+        self._step_months = {'month': n, 'quarter': 3 * n, 'year': 12 * n}.get(unit, 0)
+
+    def at(self, k: int) -> date:
+        '''
+        The _k_th date of the series (counting from 0 at `start`), computed
+        directly rather than by iterating.
+
+        RAISES
+        ------
+        IndexError
+            If the date would be after `end`.
+        '''
+        start = self.start
+        if self._step_days:
+            result = start + timedelta(days=self._step_days * k)
+        else:
+            total = start.year * 12 + start.month - 1 + self._step_months * k
+            result = start.replace(year=total // 12, month=total % 12 + 1)
+        if self.end and result > self.end:
+            raise IndexError(f'{self} index {k} is past the end date {self.end}')
+        return result
 
     def __iter__(self):
         next: date = self.start
-        while True:
-            if self.end and next > self.end:
-                break
-            # For display, we record the next date before yielding it.
-            self.next = next
-            yield next
-            match self.period.unit:
-                case 'day':
-                    next = next + timedelta(days=self.period.n)
-                case 'week':
-                    next = next + timedelta(weeks=self.period.n)
-                case 'month':
-                    next = next.replace(month=((next.month - 1) + self.period.n) % 12 + 1,
-                                        year=next.year + ((next.month - 1) + self.period.n) // 12)
-                case 'quarter':
-                    next = next.replace(month=((next.month - 1) + self.period.n * 3) % 12 + 1,
-                                        year=next.year + ((next.month - 1) + self.period.n * 3) // 12)
-                case 'year':
-                    next = next.replace(year=next.year + self.period.n)
+        end = self.end
+        # Choose the kind of step once, outside the loop.
+        if self._step_days:
+            step = timedelta(days=self._step_days)
+            while True:
+                if end and next > end:
+                    break
+                # For display, we record the next date before yielding it.
+                self.next = next
+                yield next
+                next = next + step
+        else:
+            step_months = self._step_months
+            day = next.day
+            while True:
+                if end and next > end:
+                    break
+                # For display, we record the next date before yielding it.
+                self.next = next
+                yield next
+                total = next.year * 12 + next.month - 1 + step_months
+                next = date(total // 12, total % 12 + 1, day)
 
     def __str__(self):
         return f'{self.period}'
@@ -6,10 +6,11 @@ import sys
 from collections.abc import Collection, Iterable, Iterator, Sequence
 from dataclasses import dataclass
 from datetime import date
-from itertools import chain, count, islice, tee
-from math import ceil, floor
+from itertools import chain, count, islice
+from math import ceil, floor, log10
 from typing import Any, Literal, Protocol, cast, runtime_checkable
 
+import numpy as np
 import plotext as plt_
 
 from pplt.dates import (
@@ -26,26 +27,17 @@ def choose_stride(ymin: float, ymax: float):
     but it can be more due to rounding.
     """
     yrange = ymax - ymin
-    r = floor(yrange / 10000)*1000
-    if r == 0:
-        r = floor(yrange / 1000)*100
-    if r == 0:
-        r = floor(yrange / 100)*10
-    if r == 0:
-        r = floor(yrange / 10)*1
-    if r == 0:
-        r = floor(yrange / 1)*0.1
-    if r == 0:
-        r = floor(yrange / 0.1)*0.01
-    if r == 0:
-        r = floor(yrange / 0.01)*0.001
-    if r == 0:
-        r = floor(yrange / 0.001)*0.0001
-    if r == 0:
-        r = floor(yrange / 0.0001)*0.00001
-    if r == 0:
-        r = yrange / 10
-    return r or 1.0
+    if yrange <= 0:
+        return floor(yrange / 10000)*1000 or 1.0
+    # The stride is a tenth of the largest power of ten (at most 10,000) that fits
+    # in the range, times the number of times it fits.
+    k = min(floor(log10(yrange)), 4)
+    if floor(yrange / 10.0**k) == 0:
+        # log10() rounded up just below a power of ten.
+        k -= 1
+    if k < -4:
+        return yrange / 10 or 1.0
+    return floor(yrange / 10.0**k) * 10.0**(k-1) or 1.0
 
 
 type ColorCode = Literal[
@@ -296,17 +288,18 @@ def plt_by_month(
         time = iter(time)
     time_ = (unparse_month(t) for t in time)
     end = parse_end(start, end)
-    # Copy the time iterator for each usage (series, ticks, labels)
-    xticks, *data_x = tee(time_, len(series)+1)
-    xticks = islice(xticks, 0, end + 1, ceil(end / 10))
-    figure.xticks(*tee(xticks, 2))
+    # The ticks can include the month just past the end; the data does not.
+    months_ = list(islice(time_, 0, end + 1))
+    xticks = months_[::ceil(end / 10)]
+    figure.xticks(xticks, xticks)
+    # Every series shares the same x values.
+    x = months_[:end]
     _ymin=sys.maxsize
     _ymax=0
-    for t, s, lbl, clr in zip(data_x, series, labels, colors):
-        x = list(islice(t, 0, end))
-        y = list(islice(s, 0, end))
-        _ymin = min(_ymin, min(y))
-        _ymax = max(_ymax, max(y))
+    for s, lbl, clr in zip(series, labels, colors):
+        y = np.fromiter(islice(s, 0, end), dtype=np.float64)
+        _ymin = min(_ymin, float(y.min()))
+        _ymax = max(_ymax, float(y.max()))
         figure.plot(x, y, label=lbl, color=clr, marker='hd')
     ymin, ymax = (*ylim, None, None)[:2]
     ymin = float(_ymin) if ymin is None else float(ymin)
@@ -380,8 +373,7 @@ def plt_timeline(timeline: TimelineSeries|Timeline,
             timeline = iter(timeline)
 
     date_, values = attr_split(timeline, 'date', 'values')
-    header, body = tee(values, 2)
-    first = next(header)
+    first = next(values)
     # Get the labels from the first value.
     # Uppercase the first letter of each label if it's all lowercase.
     labels = [
@@ -390,7 +382,7 @@ def plt_timeline(timeline: TimelineSeries|Timeline,
     ]
     if not include:
         include = labels
-    series = dict_split(body).values()
+    series = dict_split(chain((first,), values)).values()
     plt_by_month(*series,
                time=date_,
                end=end,
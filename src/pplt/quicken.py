@@ -2,7 +2,10 @@
 Routines to extract data from Quicken files.
 '''
 
+from collections.abc import Iterator
+from contextlib import closing
 from pathlib import Path
+from typing import Any, NamedTuple
 import sqlite3 as sql
 
 DB = Path('/tmp/quicken_data/family-2023.quicken/data')
@@ -11,8 +14,40 @@ SQL_ACCOUNTS = '''
 SELECT zaccount.z_pk, zaccount.zname as name, ztypename as type, zonlinebankingledgerbalanceamount as balance from zaccount;
 '''
 
-with sql.connect(DB) as conn:
-    cursor = conn.cursor()
-    cursor.execute(SQL_ACCOUNTS)
-    for row in cursor.fetchall():
+class QuickenAccount(NamedTuple):
+    '''
+    An account row from a Quicken database.
+    '''
+    pk: int
+    name: str
+    type: str
+    balance: float|None
+
+def _account_row(cursor: sql.Cursor, row: tuple[Any, ...]) -> QuickenAccount:
+    return QuickenAccount._make(row)
+
+def load_accounts(db: Path=DB) -> Iterator[QuickenAccount]:
+    '''
+    Read the accounts from a Quicken database.
+
+    Rows are produced as they are read. The database is not opened until the
+    first row is requested, and is closed when the rows are exhausted.
+
+    PARAMETERS
+    ----------
+    db: Path
+        The Quicken database file.
+
+    RETURNS
+    -------
+    accounts: Iterator[QuickenAccount]
+        The primary key, name, type, and balance of each account.
+    '''
+    with closing(sql.connect(db)) as conn:
+        conn.row_factory = _account_row
+        yield from conn.execute(SQL_ACCOUNTS)
+
+
+if __name__ == '__main__':
+    for row in load_accounts():
         print(row)
@@ -3,10 +3,11 @@ Terminal table printer
 '''
 
 import sys
-from collections.abc import Collection, Iterable, Iterator, Callable
+from collections.abc import Collection, Iterable, Iterator, Callable, Sequence
 from contextlib import suppress
+from functools import partial
 from datetime import date
-from itertools import chain, count, repeat, tee, islice
+from itertools import chain, count, repeat, islice
 from typing import Any, cast, overload, TYPE_CHECKING
 
 import pandas as pd
@@ -108,12 +109,14 @@ def table(series: 'TimelineSeries|Timeline',
             series = iter(series)
         case tl.TimelineSeries():
             pass
-    peek, header = tee(series, 2)
-    date_, values = attr_split(header, 'date', 'values')
+    series_ = iter(series)
     start_month = next_month()
-    with suppress(StopIteration):
-        peek = next_(peek)
-        start_month = peek.date
+    # Peek at the first step for the starting month, then put it back.
+    first = next_(series_, None)
+    if first is not None:
+        start_month = first.date
+        series_ = chain((first,), series_)
+    date_, values = attr_split(series_, 'date', 'values')
     end = parse_end(start_month, end)
     values = dict_split(values)
     include = include or values.keys()
@@ -169,10 +172,10 @@ def dataframe_table(df: pd.DataFrame,
     '''
     Print a table of values from a DataFrame.
     '''
-    return tuple_table(df.itertuples(index=False, name=None),
+    # Skip the leading rows without building tuples for them.
+    return tuple_table(df.iloc[start:].itertuples(index=False, name=None),
                     labels=labels or df.columns,
                     formats=formats,
-                    start=start,
                     end=end,
                     next=next,
                 )
@@ -221,46 +224,83 @@ def flatten_cols(labels: list[str], cols: ColumnIndex) -> tuple[int, ...]:
             raise ValueError(f'Invalid column index: {cols}')
 
 
-def find_row(labels: list[str], values: list[tuple[Any, ...]], rowid: str|date) -> int:
+def month_index(labels: list[str], values: list[tuple[Any, ...]]) -> dict[date, int]:
+    '''
+    Map each month in the 'Month' column to the first row with that month.
+    '''
     month = labels.index('Month')
+    index: dict[date, int] = {}
+    for i, row in enumerate(values):
+        index.setdefault(row[month], i)
+    return index
+
+
+def find_row(labels: list[str], values: list[tuple[Any, ...]], rowid: str|date,
+             index: dict[date, int]|None=None) -> int:
+    '''
+    Find the row for a month, given as a date or a string.
+
+    If an _index_ from `month_index` is supplied, it is used instead of
+    scanning the rows.
+    '''
     match rowid:
         case str():
             rowid = parse_month(rowid)
-            return next(i for i, d in enumerate(values) if d[month] == rowid)
         case date():
-            return next(i for i, d in enumerate(values) if d[month] == rowid)
+            pass
+    if index is None:
+        month = labels.index('Month')
+        found = next((i for i, d in enumerate(values) if d[month] == rowid), None)
+    else:
+        found = index.get(rowid)
+    if found is None:
+        raise KeyError(f'No row for month: {rowid}')
+    return found
 
 
 def extract_rows(labels: list[str],
                  values: list[tuple[Any]],
                  rows: MultiRowIndex|SingleRowIndex|list[bool],
+                 index: dict[date, int]|None=None,
                  ) -> list[tuple[Any]]:
     '''
     Extract rows using row indices.
+
+    An _index_ from `month_index` is passed on to `find_row`.
     '''
     match rows:
         case int():
             return [values[rows]]
         case str()|date():
-            return [values[find_row(labels, values, rows)]]
+            return [values[find_row(labels, values, rows, index)]]
         case slice():
                 start = (
-                    find_row(labels, values, rows.start)
+                    find_row(labels, values, rows.start, index)
                     if isinstance(rows.start, (str, date))
                     else (rows.start or 0)
                 )
                 stop = (
-                    find_row(labels, values, rows.stop)
+                    find_row(labels, values, rows.stop, index)
                     if isinstance(rows.stop, (str, date))
                     else len(values)
                 )
                 step = rows.step or 1
                 return [values[i] for i in range(start, stop, step)]
         case tuple():
+            if index is None and 'Month' in labels:
+                # Index once for the whole batch, rather than scanning per month.
+                if sum(isinstance(i, (str, date)) for i in rows) > 1:
+                    index = month_index(labels, values)
+            if all(isinstance(i, (int, str, date)) for i in rows):
+                # Single rows; no need to recurse.
+                return [
+                    values[i] if isinstance(i, int) else values[find_row(labels, values, i, index)]
+                    for i in rows
+                ]
             return [
                     c1
                     for i in rows
-                    for c1 in extract_rows(labels, values, i)
+                    for c1 in extract_rows(labels, values, i, index)
                 ]
         case list():
             return [
@@ -272,6 +312,75 @@ def extract_rows(labels: list[str],
         case _: # type: ignore
             raise ValueError(f'Invalid row index: {rows}')
 
+def format_value(value: Any, fmt: str) -> RenderableType:
+    '''
+    Format a value for a table cell.
+    '''
+    match value:
+        case date():
+            return f'{value:%y/%m}'
+        case _ if is_renderable(value):
+            return cast(RenderableType, value)
+        case float():
+            return f'{value:{fmt}}'
+        case None:
+            return '--'''
+        case _:
+            return str(value)
+
+def column_sample(values: list[tuple[Any, ...]], col: int) -> Any:
+    '''
+    The first non-`None` value in a column, or `None`.
+    '''
+    for row in values:
+        if col < len(row) and row[col] is not None:
+            return row[col]
+    return None
+
+def column_cell(fmt: str, sample: Any) -> Callable[[Any], RenderableType]:
+    '''
+    Choose a cell formatter for a column, based on a sample value from it.
+
+    Columns nearly always hold a single type. Values of that type are formatted
+    directly; anything else goes through `format_value`.
+    '''
+    cls = type(sample)
+    if cls is float:
+        def float_cell(value: Any) -> RenderableType:
+            if type(value) is float:
+                return format(value, fmt)
+            return format_value(value, fmt)
+        return float_cell
+    if cls is date:
+        def date_cell(value: Any) -> RenderableType:
+            if type(value) is date:
+                return format(value, '%y/%m')
+            return format_value(value, fmt)
+        return date_cell
+    return partial(format_value, fmt=fmt)
+
+def grid_cell(value: RenderableType|Sequence[RenderableType]) -> RenderableType:
+    '''
+    A table cell for a string, or a sequence of renderables laid out in a row:
+    the first left-justified, the last right-justified, and the rest centered.
+    '''
+    if isinstance(value, str):
+        return value
+    # Check the concrete types before the slower abstract Sequence check.
+    if isinstance(value, (list, tuple)) or isinstance(value, Sequence):
+        n = len(value)
+        grid = RichTable.grid(expand=True)
+        for i in range(n):
+            if i == 0:
+                grid.add_column(justify='left')
+            elif i == n - 1:
+                grid.add_column(justify='right')
+            else:
+                grid.add_column(justify='center')
+        grid.add_row(*value)
+        return grid
+    raise ValueError(f'Invalid value: {value}')
+
 def next_table(next_: TableContinuation|None) -> TableContinuation|None:
     match next_:
         case Iterator():
@@ -284,6 +393,9 @@ def next_table(next_: TableContinuation|None) -> TableContinuation|None:
 class Table:
     '''
     A table of values, ready to be printed
+
+    The `RichTable` is built when first needed, and kept until the labels,
+    formats or values are replaced.
     '''
     __rich_table: RichTable|None
     @property
@@ -292,25 +404,16 @@ class Table:
             table = RichTable(expand=False)
             for lbl in self.labels:
                 table.add_column(lbl, justify='center',  header_style='bold',)
-            def cell(value: Any, fmt: str) -> RenderableType:
-                match value:
-                    case date():
-                        return f'{value:%y/%m}'
-                    case _ if is_renderable(value):
-                        return cast(RenderableType, value)
-                    case float():
-                        return f'{value:{fmt}}'
-                    case None:
-                        return '--'''
-                    case _:
-                        return str(value)
-
-            for row in self.values:
-                cells = (
-                    cell(v, fmt)
-                    for v, fmt in zip(row, self.formats)
-                )
-                table.add_row(*cells)
+            values = self.values
+            cells = [
+                column_cell(fmt, column_sample(values, j))
+                for j, fmt in enumerate(self.formats)
+            ]
+            for row in values:
+                table.add_row(*(
+                    cell(v)
+                    for cell, v in zip(cells, row)
+                ))
             self.__rich_table = table
         return self.__rich_table
 
@@ -323,6 +426,8 @@ class Table:
         return self.__labels
     @labels.setter
     def labels(self, value: list[str]):
+        self.__rich_table = None
+        self.__month_index = None
         self.__labels = value
 
     __formats: list[str]
@@ -335,7 +440,39 @@ class Table:
         self.__rich_table = None
         self.__formats = fmts
 
-    values: list[tuple[Any, ...]]
+    __values: list[tuple[Any, ...]]
+    @property
+    def values(self):
+        return self.__values
+
+    @values.setter
+    def values(self, values: list[tuple[Any, ...]]):
+        self.__rich_table = None
+        self.__month_index = None
+        self.__columns = None
+        self.__values = values
+
+    __columns: list[tuple[Any, ...]]|None
+    @property
+    def columns(self) -> list[tuple[Any, ...]]|None:
+        '''
+        The values by column, built on first use. `None` if the table is empty
+        or the rows differ in length.
+        '''
+        if self.__columns is None and self.__values:
+            with suppress(ValueError):
+                self.__columns = list(zip(*self.__values, strict=True))
+        return self.__columns
+
+    __month_index: dict[date, int]|None
+    @property
+    def month_index(self) -> dict[date, int]|None:
+        '''
+        The row for each month, built on first use. `None` if there is no 'Month' column.
+        '''
+        if self.__month_index is None and 'Month' in self.__labels:
+            self.__month_index = month_index(self.__labels, self.__values)
+        return self.__month_index
 
     __next: TableContinuation|None
     @property
@@ -358,11 +495,15 @@ class Table:
                 next: TableContinuation|None=None,
             ):
         self.ncols = ncols
-        self.values = values
         self.end = end
         series = (f'Series-{i}' for i in count(len(labels)+1))
-        self.labels = list(islice(chain(labels, series), 0, ncols))
-        self.formats = list(islice(chain(formats, repeat('>,.2f')), 0, ncols))
+        # Set the fields directly; the setters are for invalidating a built table.
+        self.__values = values
+        self.__labels = list(islice(chain(labels, series), 0, ncols))
+        self.__formats = list(islice(chain(formats, repeat('>,.2f')), 0, ncols))
+        self.__rich_table = None
+        self.__month_index = None
+        self.__columns = None
         self.__next = next_table(next)
 
     def __eq__(self, other: Any):
@@ -370,6 +511,16 @@ class Table:
             return NotImplemented
         return self.labels == other.labels and self.values == other.values and self.formats == other.formats
 
+    def _extract_columns(self, c: ColumnIndex) -> tuple[Any, list[str], list[str], tuple[int, ...]]:
+        '''
+        Resolve a column index to a row extractor, and the labels, formats
+        and numbers of the selected columns.
+        '''
+        cols = flatten_cols(self.labels, c)
+        def extract(row: tuple[Any]):
+            return tuple(row[i] for i in cols)
+        return extract, [self.labels[i] for i in cols], [self.formats[i] for i in cols], cols
+
     @overload
     def __getitem__(self, i: SingleRowIndex) -> tuple[Any]:...
     @overload
@@ -383,16 +534,15 @@ class Table:
     @overload
     def __getitem__(self, i: tuple[MultiRowIndex, MultiColIndex]) -> 'Table':...
     def __getitem__(self, i: TableIndex) -> Any:
-        def extract_columns(c: ColumnIndex) -> tuple[Any, list[str], list[str]]:
-            cols = flatten_cols(self.labels, c)
-            def extract(row: tuple[Any]):
-                return tuple(row[i] for i in cols)
-            return extract, [self.labels[i] for i in cols], [self.formats[i] for i in cols]
+        if type(i) is int:
+            # The common case; skip the pattern matching.
+            return self.values[i]
+        extract_columns = self._extract_columns
         match i:
             case int():
                 return self.values[i]
             case str()|date():
-                return self.values[find_row(self.labels, self.values, i)]
+                return self.values[find_row(self.labels, self.values, i, self.month_index)]
             case slice():
                 return Table(
                     labels=self.labels,
@@ -405,14 +555,17 @@ class Table:
                     labels=self.labels,
                     formats=self.formats,
                     ncols=self.ncols,
-                    values=extract_rows(self.labels, self.values, i_),
+                    values=extract_rows(self.labels, self.values, i_, self.month_index),
                     end=self.end)
             case (slice(),
                   int()|slice()|str()|tuple()):
                 rowid, colid = i
-                rows = self.__getitem__(rowid)
-                extract, labels, formats = extract_columns(colid)
-                new_rows = [extract(row) for row in rows]
+                extract, labels, formats, cols = extract_columns(colid)
+                columns = self.columns
+                if columns is not None and cols:
+                    new_rows = list(zip(*(columns[c][rowid] for c in cols)))
+                else:
+                    new_rows = [extract(row) for row in self.values[rowid]]
                 return Table(
                     labels=labels,
                     formats=formats,
@@ -424,10 +577,10 @@ class Table:
                 rowid, colid = i
                 rows = [
                     r for s in rowid
-                    for g in extract_rows(self.labels, self.values, s)
+                    for g in extract_rows(self.labels, self.values, s, self.month_index)
                     for r in g
                 ]
-                extract, labels, formats = extract_columns(colid)
+                extract, labels, formats, _ = extract_columns(colid)
                 new_rows = [extract(row) for row in rows]
                 return Table(
                     labels=labels,
@@ -442,7 +595,7 @@ class Table:
                 return extract(row)
             case (str()|date(), int()|slice()|str()|tuple()):
                 rowid, colid = i
-                rowid = find_row(self.labels, self.values, rowid)
+                rowid = find_row(self.labels, self.values, rowid, self.month_index)
                 row = self.__getitem__(rowid)
                 extract, *_ = extract_columns(colid)
                 return extract(row)
@@ -487,30 +640,43 @@ def tuple_table(values: Iterable[tuple[Any, ...]], /, *,
         Function or `Iterator` giving the next table of values.
     '''
 
-    # extend the sequence of labels if needed.
-    labels_ = chain(labels, repeat(''))
-    labels_ = (
-        lbl if lbl else f'Series-{i+1}'
-        for i, lbl in enumerate(labels_)
-    )
-    labels_ = (
-        lbl.capitalize() if lbl.islower() else lbl
-        for lbl in labels_
-    )
-
-    formats_ = chain(formats, repeat('>,.2f'))
-    values_ = iter(values)
-    skip(start, values_)
-    # Limit the number of rows
-    tbl_values = take(end, values_)
+    if isinstance(values, Sequence):
+        # Slice directly; the continuation picks up after the slice.
+        tbl_values = list(values[start:start+end])
+        values_ = islice(values, start + end, None)
+    else:
+        values_ = iter(values)
+        skip(start, values_)
+        # Limit the number of rows
+        tbl_values = take(end, values_)
 
     if ncols is None:
         # Get the first row to determine the number of columns.
         first = tbl_values[0]
         ncols = len(first)
 
-    labels_ = take(ncols, labels_)
-    formats = take(ncols, formats_)
+    if (isinstance(labels, Sequence)
+            and len(labels) >= ncols
+            and all(lbl and not lbl.islower() for lbl in labels[:ncols])):
+        # Nothing to fill in or capitalize.
+        labels_ = list(labels[:ncols])
+    else:
+        # extend the sequence of labels if needed.
+        labels_ = chain(labels, repeat(''))
+        labels_ = (
+            lbl if lbl else f'Series-{i+1}'
+            for i, lbl in enumerate(labels_)
+        )
+        labels_ = (
+            lbl.capitalize() if lbl.islower() else lbl
+            for lbl in labels_
+        )
+        labels_ = take(ncols, labels_)
+
+    if isinstance(formats, Sequence) and len(formats) >= ncols:
+        formats = list(formats[:ncols])
+    else:
+        formats = take(ncols, chain(formats, repeat('>,.2f')))
     if next is None:
         def next():
             return tuple_table(values_, end=end, labels=labels, formats=formats)
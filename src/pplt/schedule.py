@@ -8,21 +8,20 @@ that affect the accounts.
 from datetime import date
 from heapq import heappop, heappush, heapify
 from typing import  Any, Literal, cast, overload
-from itertools import count
-from collections.abc import Iterable, Iterator, Sequence
+from itertools import count, dropwhile
+from collections.abc import Iterable, Iterator
 
-from rich.console import RenderableType
-from rich.table import Table as RichTable
-
-from pplt.rich_tables import Table
+from pplt.rich_tables import Table, grid_cell
 from pplt.timeline_series import UpdateHandler
 
-_counter = iter(count())
+_next_id = count().__next__
 
 class ScheduleEntry:
     '''
     A handler entry in the schedule.
     '''
+    __slots__ = ('start', 'handler', 'dates', 'id')
+
     start: date
     handler: UpdateHandler
     dates: Iterator[date]
@@ -40,41 +39,83 @@ class ScheduleEntry:
         else:
             self.dates = iter([handler.start])
         self.start = next(self.dates)
-        self.id = next(_counter) if id is None else id
+        self.id = _next_id() if id is None else id
 
     def __eq__(self, other: Any):
-        match other:
-            case ScheduleEntry():
-                return self.id == other.id
-            case _:
-                return False
+        if isinstance(other, ScheduleEntry):
+            return self.id == other.id
+        return False
 
     def __lt__(self, other: Any):
-        match other:
-            case ScheduleEntry():
-                return self.id < other.id
-            case _:
-                return NotImplemented
+        if isinstance(other, ScheduleEntry):
+            return self.id < other.id
+        return NotImplemented
 
-    def copy(self):
-        return ScheduleEntry(self.handler, self.id)
+    def copy(self, pending: date|None=None):
+        '''
+        Return a copy of the entry, with its own date stream.
+
+        PARAMETERS
+        ----------
+        pending: date|None
+            The entry's pending date in the schedule. The copy's stream resumes
+            after it. Default: start from the beginning.
+        '''
+        entry = ScheduleEntry(self.handler, self.id)
+        if pending is not None and pending > entry.start:
+            entry.start = pending
+            entry.dates = dropwhile(pending.__ge__, entry.dates)
+        return entry
 
     def __repr__(self):
         return f'{type(self).__name__}({self.handler}, {self.id})'
 
+_ID_BITS = 40
+'''
+The number of low bits of a heap key holding the entry ID. The high bits
+hold the date's ordinal.
+'''
+_ID_MASK = (1 << _ID_BITS) - 1
+
 class Schedule:
     '''
     A schedule of events and transactions.
 
     The schedule is a priority queue of events, ordered by date.
+
+    The heap holds integer keys, packing the date's ordinal above the entry's ID,
+    so the heap compares plain integers in date, then ID, order. The entries are
+    kept in a separate dictionary by ID.
     '''
 
     __last_run: date|None
 
-    __events: list[tuple[date, ScheduleEntry]]
+    __heap: list[int]
+    __entries: dict[int, ScheduleEntry]
     @property
     def events(self) -> list[tuple[date, ScheduleEntry]]:
-        return  self.__events
+        '''
+        The pending events as (date, entry) pairs, in heap order.
+        This is built from the heap on each access.
+        '''
+        entries = self.__entries
+        return [
+            (date.fromordinal(key >> _ID_BITS), entries[key & _ID_MASK])
+            for key in self.__heap
+        ]
+
+    def __len__(self):
+        return len(self.__heap)
+
+    def _sorted_events(self) -> list[tuple[date, ScheduleEntry]]:
+        '''
+        The pending events as (date, entry) pairs, in date and then ID order.
+        '''
+        entries = self.__entries
+        return [
+            (date.fromordinal(key >> _ID_BITS), entries[key & _ID_MASK])
+            for key in sorted(self.__heap)
+        ]
 
     @overload
     def __init__(self, events: Iterable[tuple[date, ScheduleEntry]], /, _heap: Literal[True]) -> None: ...
@@ -83,26 +124,39 @@ class Schedule:
 
     def __init__(self, events: Iterable[UpdateHandler]|Iterable[tuple[date, ScheduleEntry]]=(), /, _heap: bool=False):
         if _heap:
-            self.__events = list(cast(Iterable[tuple[date, ScheduleEntry]], events))
-            self.__last_run = None
-            return
-        _events = [
-            (handler.start, ScheduleEntry(handler))
-            for handler in cast(Iterable[UpdateHandler], events)
-        ]
-        heapify(_events)
-        self.__events = _events
+            pairs = cast(Iterable[tuple[date, ScheduleEntry]], events)
+        else:
+            pairs = (
+                (entry.start, entry)
+                for entry in map(ScheduleEntry, cast(Iterable[UpdateHandler], events))
+            )
+        heap: list[int] = []
+        entries: dict[int, ScheduleEntry] = {}
+        for date_, entry in pairs:
+            heap.append(date_.toordinal() << _ID_BITS | entry.id)
+            entries[entry.id] = entry
+        if not _heap:
+            heapify(heap)
+        self.__heap = heap
+        self.__entries = entries
         self.__last_run = None
 
     def copy(self):
         '''
         Return a copy of the schedule.
         '''
-        events = [
-            (date_, entry.copy())
-            for date_, entry in self.events
-        ]
-        return Schedule(events, _heap=True)
+        schedule = Schedule()
+        # The keys are unchanged, so the copy is already a heap.
+        heap = schedule.__heap = self.__heap.copy()
+        # Each entry has exactly one key, holding its pending date.
+        entries = self.__entries
+        fromordinal = date.fromordinal
+        schedule.__entries = {
+            key & _ID_MASK: entries[key & _ID_MASK].copy(fromordinal(key >> _ID_BITS))
+            for key in heap
+        }
+        schedule.__last_run = self.__last_run
+        return schedule
 
     def add(self,
             handler: UpdateHandler,
@@ -113,7 +167,7 @@ class Schedule:
 
         PARAMETERS
         ----------
-        handler: TimelineUpdateHandler
+        handler: UpdateHandler
             The handler for the event.
         '''
         entry = ScheduleEntry(handler)
@@ -121,7 +175,8 @@ class Schedule:
         if self.__last_run and date_ <= self.__last_run:
             raise ValueError('Can only add future dates. '
                                 f'date={date_}, last_run={self.__last_run}')
-        heappush(self.events, (date_, entry))
+        self.__entries[entry.id] = entry
+        heappush(self.__heap, date_.toordinal() << _ID_BITS | entry.id)
 
     def run(self, until: date) -> 'Iterable[tuple[date, UpdateHandler]]':
         '''
@@ -136,39 +191,28 @@ class Schedule:
             raise ValueError('Can only run to future dates. '
                              f'date={until}, last_run={self.__last_run}')
         self.__last_run = until
-        while self.__events and self.__events[0][0] <= until:
-            date_, h = heappop(self.__events)
-            yield date_, h.handler
+        heap = self.__heap
+        entries = self.__entries
+        pop, push, fromordinal = heappop, heappush, date.fromordinal
+        # Keys below this are on or before the until date.
+        limit = (until.toordinal() + 1) << _ID_BITS
+        while heap and heap[0] < limit:
+            key = pop(heap)
+            id_ = key & _ID_MASK
+            h = entries[id_]
+            yield fromordinal(key >> _ID_BITS), h.handler
             # Add the next date for the handler.
             try:
                 date_ = next(h.dates)
-                heappush(self.__events, (date_, h))
+                push(heap, date_.toordinal() << _ID_BITS | id_)
             except StopIteration:
-                pass
+                del entries[id_]
 
     @property
     def table(self):
         '''
         Return a table of the events in the schedule.
         '''
-        def cell(value: RenderableType|Sequence[RenderableType]):
-            match value:
-                case str():
-                    return value
-                case Sequence():
-                    grid = RichTable.grid(expand=True)
-                    for i in range(len(value)):
-                        match i:
-                            case 0:
-                                grid.add_column(justify='left')
-                            case _ if i == len(value) - 1:
-                                grid.add_column(justify='right')
-                            case _:
-                                grid.add_column(justify='center')
-                    grid.add_row(*value)
-                    return grid
-                case _: # type: ignore
-                    raise ValueError(f'Invalid value: {value}')
         def extract(event: tuple[date, ScheduleEntry]):
             date_, entry = event
             handler = entry.handler
@@ -176,12 +220,12 @@ class Schedule:
             end = period.end if period else None
             n = period.n if period else None
             unit = period.unit if period else None
-            accounts = cell(handler.accounts)
-            description = cell(handler.description)
-            period_ = cell((f'{n: 3}', str(unit))) if period else None
+            accounts = grid_cell(handler.accounts)
+            description = grid_cell(handler.description)
+            period_ = grid_cell((f'{n: 3}', str(unit))) if period else None
             return date_, period_, end, accounts, handler.__name__, description
 
-        events = sorted(self.events)
+        events = self._sorted_events()
         return Table(values=list(map(extract, events)),
                     labels=['Month', ' Period  ', ' End ', 'Accounts', 'Handler', 'Details'],
                     ncols=6,
@@ -189,7 +233,7 @@ class Schedule:
                     end=len(events))
 
     def __repr__(self):
-        return f'Schedule({sorted(self.events)}, last_run={self.__last_run})'
+        return f'Schedule({self._sorted_events()}, last_run={self.__last_run})'
 
 
 def schedule(*handlers: UpdateHandler):
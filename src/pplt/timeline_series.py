@@ -4,22 +4,22 @@ for each account, on a monthly basis.
 '''
 
 from abc import abstractmethod
+from bisect import bisect_left
 from collections.abc import Callable, Generator, Mapping, Sequence, Iterator
 from dataclasses import dataclass, field
-from datetime import date, timedelta
+from datetime import date
 from typing import (
     TYPE_CHECKING, Any, ClassVar, NoReturn, Protocol, cast, overload, runtime_checkable,
 )
 from weakref import WeakKeyDictionary
 
 from rich.console import RenderableType
-from rich.table import Table as RichTable
 
 
 from pplt.account import Account, AccountUpdate, AccountValue
-from pplt.dates import days_per_month, parse_month, next_month, month_plus
+from pplt.dates import parse_month, next_month, month_plus
 from pplt.period import Periodic
-from pplt.rich_tables import tuple_table
+from pplt.rich_tables import grid_cell, tuple_table
 if TYPE_CHECKING:
     import pplt.schedule as sch
 
@@ -43,11 +43,14 @@ type CurrentAccountValues = dict[str, AccountValue]
 The current values of the accounts in the timeline.
 '''
 
-@dataclass
+@dataclass(slots=True)
 class TimelineStep:
     '''
     A step in the timeline, with the date, account iterators, current schedule,
     and the values of the accounts.
+
+    A new step is produced for each month, as consumers (such as `table()`)
+    may hold on to earlier steps.
     '''
     date: date
     timeline: 'Timeline'
@@ -207,6 +210,7 @@ class Timeline:
             }
             # Start with the initial schedule, which will be modified by the events.
             schedule = self.schedule.copy()
+            year, month = date_.year, date_.month
             while True:
                 states =  {k: next(v) for k, v in accounts.items()}
                 step = TimelineStep(date_, self, schedule, accounts, states)
@@ -215,13 +219,21 @@ class Timeline:
                 # deviate from how the real world usually works, with a reconciliation
                 # step, usually daily rather than monthly, applying all the updates
                 # at once.
-                for step_date, event in schedule.run(date_):
-                    assert step_date <= date_
-                    if step_date > step.date:
-                        step = TimelineStep(step_date, self, schedule, accounts, states)
-                    event(step)
+                # Once the schedule runs dry, there is nothing to run.
+                if schedule:
+                    for step_date, event in schedule.run(date_):
+                        assert step_date <= date_
+                        if step_date > step.date:
+                            step = TimelineStep(step_date, self, schedule, accounts, states)
+                        event(step)
                 yield step
-                date_ = date_ + timedelta(days=days_per_month(date_))
+                # Steps are on the first of the month, so build the next one directly.
+                if month == 12:
+                    year += 1
+                    month = 1
+                else:
+                    month += 1
+                date_ = date(year, month, 1)
         # Make it a bit easier to recognize series generator.
         # We can't override the __class__ or add attributes.
         TimelineSeries_.__name__ = 'TimelineSeries'
@@ -246,11 +258,12 @@ class Timeline:
         '''
 
         for step in self:
-            if not self.schedule.events:
-                break
             date_ = step.date
             for (name, handler, update, balance) in step.transactions:
                 yield (date_, name, handler, update, balance)
+            # No events left to produce transactions.
+            if not step.schedule:
+                break
 
     def transaction_table(self, /, *,
                           start: int=0,
@@ -258,34 +271,26 @@ class Timeline:
                           accounts: Sequence[str]=(),
                           handlers: Sequence[str]=()
                           ) -> RenderableType|str:
-        def cell(value: RenderableType|Sequence[RenderableType]):
-            match value:
-                case str():
-                    return value
-                case Sequence():
-                    grid = RichTable.grid(expand=True)
-                    for i in range(len(value)):
-                        match i:
-                            case 0:
-                                grid.add_column(justify='left')
-                            case _ if i == len(value) - 1:
-                                grid.add_column(justify='right')
-                            case _:
-                                grid.add_column(justify='center')
-                    grid.add_row(*value)
-                    return grid
-                case _: # type: ignore
-                    raise ValueError(f'Invalid value: {value}')
+        # The transactions seen so far, shared by all the pages, so each page
+        # continues the simulation rather than rerunning it from the start.
+        transactions = self.transactions
+        seen: list[tuple[date, str, UpdateHandler, AccountUpdate, AccountValue]] = []
+        seen_dates: list[date] = []
         def series(start_month: date, end_month: date):
-            for d, a, h, v, b in self.transactions:
-                if d < start_month:
-                    continue
-                if d >= end_month:
+            # Read ahead to the first transaction on or after the end month.
+            while not seen_dates or seen_dates[-1] < end_month:
+                t = next(transactions, None)
+                if t is None:
                     break
+                seen.append(t)
+                seen_dates.append(t[0])
+            lo = bisect_left(seen_dates, start_month)
+            hi = bisect_left(seen_dates, end_month, lo)
+            for d, a, h, v, b in seen[lo:hi]:
                 if ((not accounts or a in accounts)
                     and
                     ((not handlers or h.__name__ in handlers))):
-                    yield d, a, h.__name__, cell(h.description), v, b
+                    yield d, a, h.__name__, grid_cell(h.description), v, b
         def table(start: int, end: int) -> RenderableType:
             start_month: date = month_plus(next_month(), start)
             end_month = month_plus(next_month(), end)
@@ -2,8 +2,12 @@
 Utilities for special iterators, etc, etc.
 """
 
-from itertools import islice, tee
-from collections.abc import Hashable, Iterable, Iterator
+from __future__ import annotations
+
+from collections import deque
+from itertools import chain, islice, repeat
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from operator import attrgetter, itemgetter
 from typing import Any, cast, overload
 
 from rich.console import Console
@@ -27,9 +31,11 @@ def take[T](n: int, x: Iterator[T]) -> list[T]:
     RETURNS
     -------
     list[T]
-        List wil be [] if the iterator is empty.
+        List wil be [] if the iterator is empty, or n <= 0.
     """
-    return list(islice(x, 0, n))
+    if n <= 0:
+        return []
+    return list(islice(x, n))
 
 def skip[T](n: int, x: Iterator[T]) -> Iterator[T]:
     """
@@ -45,55 +51,93 @@ def skip[T](n: int, x: Iterator[T]) -> Iterator[T]:
     RETURNS
     -------
     Iterator[T]
+        The same iterator. It is exhausted if it had fewer than n items.
     """
-    for _ in range(n):
-        next(x)
+    # Drain in C, rather than calling next() n times.
+    deque(islice(x, n), maxlen=0)
     return x
 
 def dict_join[K: Hashable, T](d: dict[K, Iterable[T]]|Any) -> Iterator[dict[K, T]]:
     """
     Iterate over a dictionary's iterable values in parallel,
     returning an iterator of dictionaries.
+
+    Values that are not iterable are repeated in every dictionary.
     """
-    state = {k: iter(cast(Iterable[T], v)) if isinstance(v, Iterable) else v
-             for k, v in d.items()}
-    try:
+    keys = tuple(d.keys())
+    if not keys:
         while True:
-            yield {k: next(cast(Iterator[T], v)) if isinstance(v, Iterator) else v
-                for k, v in state.items()}
-    except StopIteration:
-        pass
+            yield {}
+    # Constants are repeated, so zip() can step all the values together.
+    its = [iter(v) if isinstance(v, Iterable) else repeat(v)
+           for v in d.values()]
+    yield from map(dict, map(zip, repeat(keys), zip(*its)))
+
+
+def _fanout(src: Iterator[Any], get: Callable[[Any], Any], n: int) -> tuple[Iterator[Any], ...]:
+    """
+    Split an iterator into _n_ lazy iterators, one per value extracted by _get_.
+
+    Each item is read from _src_ once, and its _n_ values are buffered for the
+    output iterators, which may be consumed at different rates.
+
+    PARAMETERS
+    ----------
+    src: Iterator[Any]
+        The source iterator.
+    get: Callable[[Any], Any]
+        Extracts the values from an item, as a tuple of _n_ values. If _n_ is 1,
+        it returns the single value itself, as `itemgetter` and `attrgetter` do.
+    n: int
+        The number of output iterators.
+    """
+    bufs = [deque[Any]() for _ in range(n)]
+    appends = [b.append for b in bufs]
+    if n == 1:
+        append = appends[0]
+        def pump() -> bool:
+            for item in src:
+                append(get(item))
+                return True
+            return False
+    else:
+        def pump() -> bool:
+            for item in src:
+                for append, v in zip(appends, get(item)):
+                    append(v)
+                return True
+            return False
+    def column(buf: deque[Any]) -> Iterator[Any]:
+        popleft = buf.popleft
+        while buf or pump():
+            yield popleft()
+    return tuple(column(b) for b in bufs)
 
 
 def dict_split[K: Hashable, T](joined: Iterator[dict[K, T]]) -> dict[K, Iterator[T]]:
     """
     Split an iterator of dictionaries into a dictionary of iterators.
+
+    The keys are taken from the first dictionary. Each dictionary is read once.
     """
-    peek, main = tee(joined)
-    first = next(peek)
-    keys = first.keys()
-    def split(key: K, d: Iterator[dict[K, T]]) -> Iterator[T]:
-        try:
-            while True:
-                n = next(d)
-                yield n[key]
-        except StopIteration:
-            pass
-    return {key: split(key, d) for key, d in zip(keys, tee(main, len(keys)))}
+    joined = iter(joined)
+    first = next(joined)
+    keys = tuple(first.keys())
+    if not keys:
+        return {}
+    columns = _fanout(chain((first,), joined), itemgetter(*keys), len(keys))
+    return dict(zip(keys, columns))
 
 
 def attr_split(joined: Iterator[Any], *attrs: str):
     """
-    Split an iterator of objects into subiterators.
+    Split an iterator of objects into subiterators, one per attribute.
+
+    Each object is read once.
     """
-    def split(key: str, d: Any):
-        try:
-            while True:
-                n = next(d)
-                yield getattr(n, key)
-        except StopIteration:
-            pass
-    return [split(key, d) for key, d in zip(attrs, tee(joined, len(attrs)))]
+    if not attrs:
+        return []
+    return list(_fanout(iter(joined), attrgetter(*attrs), len(attrs)))
 
 
 def sum_iterators[T: float|acct.AccountValue](*its: Iterable[T]) -> Iterator[T]:
@@ -203,8 +247,11 @@ def unzip[T](x: Iterable[tuple[T, ...]],
     the `zip` function. The number of items in the tuples is determined by the first
     tuple in the iterator, unless _n_ is specified. In this case, the number of
     iterators is _n_, regardless of the number of items in the tuples. If a tuple is
-    shorter than the number of iterators, the extra iterators will raise `IndexError`.
-    If a tuple is longer, the extra items will be ignored.
+    shorter than the number of iterators, the iterator that reaches it will raise
+    `IndexError`. If a tuple is longer, the extra items will be ignored.
+
+    Each tuple is read once, and its items are buffered until each iterator
+    consumes them.
 
     If _n_ is unspecified, and a zero-length `Iterable` is passed for _x_,
     the function will raise a `ValueError`. If specified, it will return
@@ -217,23 +264,16 @@ def unzip[T](x: Iterable[tuple[T, ...]],
     n: Optional[int]
         The number of items in each tuple.
     """
+    main = iter(x)
     if n is None:
-        peek, main = tee(x, 2)
         try:
-            first = next(peek)
+            first = next(main)
         except StopIteration:
             raise ValueError(
                 "Cannot unzip zero-length iterable without specifying n."
                 ) from None
         n = len(first)
-    else:
-        main = x
-    iters = tee(main, n)
-    def split(it: Iterator[tuple[T, ...]], i: int) -> Iterator[T]:
-        try:
-            while True:
-                t = next(it)
-                yield t[i]
-        except StopIteration:
-            pass
-    return tuple(split(iters[i], i) for i in range(n))
+        main = chain((first,), main)
+    if n == 0:
+        return ()
+    return _fanout(main, itemgetter(*range(n)), n)
@@ -2,29 +2,26 @@
 Tests for the time module.
 '''
 
+from calendar import isleap
 from datetime import date, timedelta
-from itertools import islice
+
+import numpy as np
 
 from pplt.dates import (
     days_per_month, next_month, months, months_str,
     parse_month, unparse_month, parse_end
 )
+from pplt.utils import take
 
 def test_days_per_month():
-    assert days_per_month(1) == 31
-    assert days_per_month(2) == (28 if date.today().year % 4 else 29)
-    assert days_per_month(3) == 31
-    assert days_per_month(4) == 30
-    assert days_per_month(5) == 31
-    assert days_per_month(6) == 30
-    assert days_per_month(7) == 31
-    assert days_per_month(8) == 31
-    assert days_per_month(9) == 30
-    assert days_per_month(10) == 31
-    assert days_per_month(11) == 30
-    assert days_per_month(12) == 31
+    feb = 29 if isleap(date.today().year) else 28
+    assert [days_per_month(m) for m in range(1, 13)] == [
+        31, feb, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31
+    ]
     assert days_per_month(date(2021, 2, 1)) == 28
     assert days_per_month(date(2020, 2, 1)) == 29
+    assert days_per_month(date(2100, 2, 1)) == 28
+    assert days_per_month(date(2000, 2, 1)) == 29
 
 def test_next_month():
     nm =  next_month()
@@ -34,22 +31,19 @@ def test_next_month():
     assert nm - today <= timedelta(days=days_per_month(today))
 
 def test_months():
-    start = date(2021, 1, 1)
-    previous = date(2020, 12, 1)
-    ms = months(start)
-    for _ in range(120):
-        m = next(ms)
-        assert m.day == 1
-        assert m - previous == timedelta(days=days_per_month(previous))
-        previous = m
+    start = np.datetime64('2021-01', 'M')
+    expected = np.arange(start, start + np.timedelta64(120, 'M')).astype('datetime64[D]').tolist()
+    assert take(120, months(date(2021, 1, 1))) == expected
+
+MONTHS_2021 = [
+    '21/01', '21/02', '21/03', '21/04', '21/05', '21/06',
+    '21/07', '21/08', '21/09', '21/10', '21/11', '21/12',
+]
 
 def test_months_str():
     start = date(2021, 1, 1)
     ms = months_str(start)
-    assert list(islice(ms, 0, 12)) == [
-        '21/01', '21/02', '21/03', '21/04', '21/05', '21/06',
-        '21/07', '21/08', '21/09', '21/10', '21/11', '21/12'
-    ]
+    assert take(12, ms) == MONTHS_2021
 
 def test_parse_month():
     assert parse_month('21/01') == date(2021, 1, 1)
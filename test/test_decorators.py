@@ -17,14 +17,14 @@ from pplt.schedule import Schedule
 from pplt.timeline_series import Timeline, TimelineStep, TimelineAccountStates
 
 
-def make_step(*keys: str):
+def make_step(*keys: str, month: str='21/1'):
     accounts = {k: Account(k, 1000.00) for k in keys}
     states: TimelineAccountStates = {
         k: iter(a)
         for k, a in accounts.items()
     }
     values = {k: next(a) for k, a in states.items()}
-    step = TimelineStep(parse_month('21/1'),
+    step = TimelineStep(parse_month(month),
                         schedule=Schedule(),
                         timeline=cast(Timeline, None),
                         states=states,
@@ -95,6 +95,27 @@ def test_event_invocation_early():
     assert accounts['account'].amount == 1000.00
 
 
+def test_event_invocation_early_after_late():
+    '''
+    Running an event on a later step, as in another timeline, does not let it
+    run on an early step.
+    '''
+    @event()
+    def interest(date_: date, state: AccountValue, /,
+                rate: float,
+        **_):
+        'Calculate interest on an account.'
+        return float(state) * rate
+
+    f2 = interest('account', parse_month('21/2'), rate=0.10)
+    _, late = make_step('account', month='21/3')
+    f2(late)
+    assert next(late.states['account']) == approx(1100.00)
+    _, step = make_step('account')
+    f2(step)
+    assert next(step.states['account']) == approx(1000.00)
+
+
 def test_transaction():
     @transaction()
     def transfer(date: date, from_state: AccountValue, to_state: AccountValue, /,
@@ -0,0 +1,23 @@
+'''
+Test cases for events.py
+'''
+
+from datetime import date
+from typing import cast
+
+import pytest
+
+from pplt.account import AccountStatus, AccountValue
+from pplt.currency import valid_currency
+from pplt.decorators import EventWrapper
+from pplt.events import interest
+from pplt.interest_utils import monthly_rate
+
+
+@pytest.mark.parametrize('status', ['open', 'future', 'closed'])
+def test_interest_matches_mul(status: str):
+    state = AccountValue(1234.56, cast(AccountStatus, status), valid_currency('USD'))
+    handler = cast(EventWrapper, interest('Bank', '21/1', rate=5.0))
+    update = handler.func(date(2021, 1, 1), state, rate=5.0)
+    assert update == state * monthly_rate(0.05)
+    assert update.status == status
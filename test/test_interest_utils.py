@@ -2,11 +2,12 @@
 Tests for the interest module.
 '''
 
+import numpy as np
 from pytest import approx # type: ignore
 
 from pplt.interest_utils import (
-    daily_pct, daily_rate, monthly_pct,
-    monthly_rate, quarterly_pct, quarterly_rate,
+    apr, apr_array, daily_pct, daily_rate, daily_rate_array, monthly_pct,
+    monthly_rate, monthly_rate_array, quarterly_pct, quarterly_rate, rate_of_return,
 )
 
 def test_monthly_rate():
@@ -29,3 +30,15 @@ def test_quarterly_rate():
 
 def test_quarterly_pct():
     assert 1_000*(1+quarterly_pct(10)/100)**4 == approx(1_100.0)
+
+def test_rate_arrays():
+    rates = np.array([0.0, 0.05, 0.10])
+    assert list(monthly_rate_array(rates)) == approx([monthly_rate(r) for r in rates])
+    assert list(daily_rate_array(rates)) == approx([daily_rate(r) for r in rates])
+    for unit in ('day', 'week', 'month', 'quarter', 'year'):
+        assert list(apr_array(rates, unit)) == approx([apr(r, unit) for r in rates])
+
+def test_rate_of_return_dates():
+    assert rate_of_return('2021-01-05', 100, '2022-01-05', 110) == approx(0.1, abs=1e-3)
+    # Not zero-padded.
+    assert rate_of_return('2021-1-5', 100, '2022-1-5', 110) == approx(0.1, abs=1e-3)
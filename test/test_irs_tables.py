@@ -0,0 +1,36 @@
+'''
+Tests for the irs_tables module.
+'''
+
+import numpy as np
+import pytest
+
+from pplt.irs_tables import IRS_2024, FilingStatus
+
+RATES = [0.10, 0.12, 0.22, 0.24, 0.32, 0.35, 0.37]
+THRESHOLDS: dict[FilingStatus, list[float]] = {
+    'Single': [0, 11600, 47150, 100525, 191950, 243725, 609350],
+    'Joint': [0, 23200, 94300, 201050, 383900, 487450, 731200],
+    'Household': [0, 16550, 63100, 100500, 191950, 243700, 609350],
+}
+
+@pytest.mark.parametrize('status', THRESHOLDS)
+def test_lookup_boundaries(status: FilingStatus):
+    lookup = IRS_2024.lookup
+    for rate, threshold in zip(RATES, THRESHOLDS[status]):
+        # A threshold starts its bracket.
+        assert lookup(threshold, status) == rate
+        assert lookup(threshold + 0.01, status) == rate
+    for rate, threshold in zip(RATES, THRESHOLDS[status][1:]):
+        # Just below a threshold is still in the previous bracket.
+        assert lookup(threshold - 0.01, status) == rate
+    # Below the first threshold, and above the last.
+    assert lookup(-100.0, status) == RATES[0]
+    assert lookup(10_000_000.0, status) == RATES[-1]
+
+@pytest.mark.parametrize('status', THRESHOLDS)
+def test_lookup_many(status: FilingStatus):
+    thresholds = np.array(THRESHOLDS[status], dtype=np.float64)
+    incomes = np.concatenate([[-100.0, 10_000_000.0], thresholds, thresholds - 0.01])
+    expected = [IRS_2024.lookup(float(income), status) for income in incomes]
+    assert list(IRS_2024.lookup_many(incomes, status)) == expected
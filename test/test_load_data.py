@@ -2,9 +2,10 @@
 Test load_data
 '''
 
+import os
 from pathlib import Path
 
-from pplt.loader import load_scenario
+from pplt.loader import LOADERS, genid, load_scenario, load_scenario_yaml
 
 ROOT=Path(__file__).parent.parent
 
@@ -13,3 +14,47 @@ def test_load():
     At least test our example file.
     '''
     load_scenario(ROOT / 'data.yml')
+
+def test_genid_unique():
+    assert genid() != genid()
+
+def test_override_before_import(tmp_path: Path):
+    '''
+    Local entries override imported ones, even if they precede the import.
+    '''
+    (tmp_path / 'base.yml').write_text(
+        'id: acct\ntype: account\nname: Bank\namount: 100.0\n')
+    (tmp_path / 'alt.yml').write_text(
+        'id: acct\namount: 200.0\n---\ntype: import\nfile: base.yml\n')
+    by_id = load_scenario_yaml(tmp_path / 'alt.yml')
+    assert by_id['acct']['amount'] == 200.0
+    assert by_id['acct']['name'] == 'Bank'
+
+def test_loader_kind():
+    assert LOADERS['account'].kind == 'account'
+    assert LOADERS['interest'].kind == 'handler'
+    assert LOADERS['transfer'].kind == 'handler'
+
+def test_load_scenario_yaml_cached(tmp_path: Path):
+    '''
+    Repeated loads share the parse, but not the entries.
+    '''
+    scenario = tmp_path / 'base.yml'
+    scenario.write_text('id: acct\ntype: account\nname: Bank\namount: 100.0\n')
+    first = load_scenario_yaml(scenario)
+    first['acct']['amount'] = 0.0
+    assert load_scenario_yaml(scenario)['acct']['amount'] == 100.0
+
+def test_load_scenario_yaml_import_edited(tmp_path: Path):
+    '''
+    Edits to an imported file are seen by the file importing it.
+    '''
+    base = tmp_path / 'base.yml'
+    base.write_text('id: acct\ntype: account\nname: Bank\namount: 100.0\n')
+    (tmp_path / 'alt.yml').write_text('type: import\nfile: base.yml\n')
+    assert load_scenario_yaml(tmp_path / 'alt.yml')['acct']['amount'] == 100.0
+    base.write_text('id: acct\ntype: account\nname: Bank\namount: 555.0\n')
+    # Make sure the modification time changes, whatever the clock resolution.
+    mtime = base.stat().st_mtime_ns + 1_000_000_000
+    os.utime(base, ns=(mtime, mtime))
+    assert load_scenario_yaml(tmp_path / 'alt.yml')['acct']['amount'] == 555.0
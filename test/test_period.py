@@ -0,0 +1,31 @@
+'''
+Tests for the period module.
+'''
+
+from datetime import date
+from itertools import islice
+
+import pytest
+
+from pplt.period import Periodic, PeriodUnit
+
+@pytest.mark.parametrize('n,unit', [
+    (1, 'day'),
+    (10, 'day'),
+    (2, 'week'),
+    (1, 'month'),
+    (5, 'month'),
+    (1, 'quarter'),
+    (1, 'year'),
+    (3, 'year'),
+])
+def test_periodic_at(n: int, unit: PeriodUnit):
+    p = Periodic(date(2021, 11, 1), n, unit)
+    expected = list(islice(p, 30))
+    assert [p.at(k) for k in range(30)] == expected
+
+def test_periodic_at_end():
+    p = Periodic(date(2021, 1, 1), 1, 'month', end=date(2021, 6, 1))
+    assert p.at(5) == date(2021, 6, 1)
+    with pytest.raises(IndexError):
+        p.at(6)
@@ -0,0 +1,20 @@
+'''
+Test the plotting utilities.
+'''
+
+import pytest
+
+from pplt.plot import choose_stride
+
+@pytest.mark.parametrize('ymin, ymax, stride', [
+    (0.0, 0.0, 1.0),
+    (0.0, 5.0, 0.5),
+    (0.0, 10.0, 1.0),
+    (0.0, 999.0, 90.0),
+    (0.0, 1000.0, 100.0),
+    (100.0, 25100.0, 2000.0),
+    (0.0, 1_000_000.0, 100_000.0),
+    (0.0, 0.05, 0.005),
+])
+def test_choose_stride(ymin: float, ymax: float, stride: float):
+    assert choose_stride(ymin, ymax) == pytest.approx(stride)
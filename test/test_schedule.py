@@ -5,11 +5,11 @@ Test cases for schedule.py
 from collections.abc import Iterator
 from collections import Counter
 from datetime import date
-from typing import Literal, cast
+from typing import Any, Literal, cast
 
 import pytest
 
-from pplt.period import Period
+from pplt.period import Period, Periodic
 from pplt.timeline_series import (
     TimelineStep, TimelineAccountStates, CurrentAccountValues, UpdateHandler, Timeline,
 )
@@ -112,3 +112,32 @@ def test_schedule(sequence: ScheduleTest):
                         pass
             case _: # pragma: no cover # type: ignore
                 raise ValueError(f'Invalid test step: {entry}')
+
+def test_schedule_copy():
+    '''
+    A copy runs independently of the original.
+    '''
+    sch = Schedule()
+    handler = CallHandler()
+    sch.add(cast(UpdateHandler, handler))
+    copy = sch.copy()
+    assert len(copy) == len(sch) == 1
+    assert [d for d, _ in copy.run(parse_month('22/01'))] == [date(2022, 1, 1)]
+    assert len(copy) == 0
+    assert sch.events[0][0] == date(2022, 1, 1)
+
+
+def test_schedule_copy_resumes():
+    '''
+    A copy of a schedule that has been run resumes where the original left off.
+    '''
+    handler = CallHandler()
+    handler.period = cast(Any, Periodic(date(2022, 1, 1), 1, 'month', date(2022, 4, 1)))
+    sch = Schedule([cast(UpdateHandler, handler)])
+    assert [d for d, _ in sch.run(date(2022, 2, 1))] == [date(2022, 1, 1), date(2022, 2, 1)]
+    copy = sch.copy()
+    with pytest.raises(ValueError):
+        list(copy.run(date(2022, 2, 1)))
+    assert [d for d, _ in copy.run(date(2022, 12, 1))] == [date(2022, 3, 1), date(2022, 4, 1)]
+    assert len(copy) == 0
+    assert [d for d, _ in sch.run(date(2022, 3, 1))] == [date(2022, 3, 1)]
@@ -3,12 +3,14 @@ Tests for the rich_tables module.
 '''
 
 from datetime import date
+from operator import itemgetter
 from typing import Any
 
 import pytest
 
 from pplt.dates import parse_month
-from pplt.rich_tables import Table
+from pplt.rich_tables import Table, table
+from pplt.timeline_series import timeline
 
 def r(month:str, *v: float) -> tuple[date, *tuple[float, ...]]:
     '''
@@ -54,7 +56,7 @@ def c(values: list[tuple[Any, ...]],
     '''
     Slice by columns
     '''
-    return list(map(lambda r: r[slice_], values))
+    return list(map(itemgetter(slice_), values))
 
 base_table = t(
         *base_data,
@@ -73,22 +75,34 @@ def test_table(simple_table: Table):
     assert t.end == 12
 
 @pytest.mark.parametrize('i,v', [
-    (0,     r('21/01', 1000.00, 500.00, 1500.00)),
-    (1,     r('21/02', 2000.00, 500.00, 1500.00)),
-    (2,     r('21/03', 3000.00, 500.00, 1500.00)),
-    (3,     r('21/04', 4000.00, 500.00, 1500.00)),
-    (4,     r('21/05', 5000.00, 500.00, 1500.00)),
-    (5,     r('21/06', 6000.00, 500.00, 1500.00)),
-    (6,     r('21/07', 7000.00, 500.00, 1500.00)),
-    (7,     r('21/08', 8000.00, 500.00, 1500.00)),
-    (8,     r('21/09', 9000.00, 500.00, 1500.00)),
-    (9,     r('21/10', 10000.00, 500.00, 1500.00)),
-    (10,    r('21/11', 11000.00, 500.00, 1500.00)),
-    (11,    r('21/12', 12000.00, 500.00, 1500.00)),
+    *enumerate(base_data),
+    ('21/03', base_data[2]),
+    (date(2021, 12, 1), base_data[11]),
     (slice(None), base_table),
+    (((0, '21/03', date(2021, 5, 1)),), t(base_data[0], base_data[2], base_data[4])),
     (slice(0, 3), t(*base_data[:3])),
     ((slice(0, 3), slice(0, 2)), t(*c(base_data[:3], slice(0, 2)))),
+    ((slice(1, 6, 2), slice(1, 3)), t(*c(base_data[1:6:2], slice(1, 3)),
+                                      labels=default_labels[1:3], formats=default_formats[1:3])),
 ])
 def test_table_subscription(i: Any, v: Any, simple_table: Table):
     t = simple_table
-    assert t[i] == v
\ No newline at end of file
+    assert t[i] == v
+
+def test_rich_table_cached():
+    tbl = t(*base_data[:2])
+    rt = tbl.rich_table
+    assert tbl.rich_table is rt
+    tbl.values = base_data[:3]
+    assert tbl.rich_table is not rt
+    assert tbl.rich_table.row_count == 3
+
+def test_table_missing_month(simple_table: Table):
+    with pytest.raises(KeyError):
+        simple_table['22/01']
+
+
+def test_table_no_accounts():
+    tbl = table(timeline(), end=3)
+    assert tbl.labels == ['Month']
+    assert len(tbl.values) == 3
@@ -2,19 +2,35 @@
 Tests of the timeline module.
 '''
 
+from datetime import date
+
 from pplt.dates import next_month
+from pplt.schedule import Schedule
 from pplt.timeline_series import timeline
+from pplt.transaction import transfer
 
 def test_timeline_basic():
     tl = timeline()
     sch = tl.schedule
-    assert tl is not None
-    assert sch.events == []
-    assert tl.start == next_month()
-    series = iter(tl)
-    step = next(series)
-    assert step.date == tl.start
-    assert step.schedule != sch
-    assert step.schedule.events == []
-    assert step.states == {}
-    assert step.values == {}
+    step = next(iter(tl))
+    # The step runs a copy of the (empty) schedule.
+    assert (tl.start, sch.events, step.date, step.schedule is sch,
+            step.schedule.events, step.states, step.values) \
+        == (next_month(), [], tl.start, False, [], {}, {})
+
+
+def test_transactions_finite():
+    '''
+    Once a schedule of one-off events is exhausted, the transactions end.
+    '''
+    tl = timeline(Schedule([transfer('a', 'b', '25/2', amount=10.0),
+                            transfer('b', 'a', '25/4', amount=4.0)]),
+                  '25/1', a=100.0, b=0.0)
+    rows = [(date_, name, float(update), float(balance))
+            for date_, name, _, update, balance in tl.transactions]
+    assert rows == [
+        (date(2025, 2, 1), 'a', -10.0, 90.0),
+        (date(2025, 2, 1), 'b', 10.0, 10.0),
+        (date(2025, 4, 1), 'b', -4.0, 6.0),
+        (date(2025, 4, 1), 'a', 4.0, 94.0),
+    ]
@@ -3,7 +3,9 @@ Test the functions in the utils module.
 '''
 
 
-from itertools import islice
+from itertools import count, islice
+
+import pytest
 
 from pplt.utils import dict_join, dict_split, take, skip, unzip
 
@@ -16,30 +18,55 @@ def test_skip():
     it = iter([1, 2, 3, 4, 5, 6])
     skip(3, it)
     assert list(it) == [4, 5, 6]
+    assert list(skip(2, iter([1]))) == []
+
+
+@pytest.fixture(scope='module')
+def dj_input() -> dict[str, list[int]]:
+    '''
+    Input for dict_join. It is only iterated, never modified, so it can be shared.
+    '''
+    return {'a': [1, 2, 3], 'b': [4, 5, 6]}
 
 
-def test_dict_join():
-    dj = dict_join({'a': [1, 2, 3], 'b': [4, 5, 6]})
+def test_dict_join(dj_input: dict[str, list[int]]):
+    dj = dict_join(dj_input)
     assert next(dj) == {'a': 1, 'b': 4}
     assert next(dj) == {'a': 2, 'b': 5}
 
 
-def test_dict_join_islice():
-    dj = dict_join({'a': [1, 2, 3], 'b': [4, 5, 6]})
+def test_dict_join_islice(dj_input: dict[str, list[int]]):
+    dj = dict_join(dj_input)
     assert list(islice(dj, 3)) == [
         {'a': 1, 'b': 4},
         {'a': 2, 'b': 5},
         {'a': 3, 'b': 6}
     ]
 
-def test_dict_split():
-    ds = dict_split(dict_join({'a': [1, 2, 3], 'b': [4, 5, 6]}))
+def test_dict_split(dj_input: dict[str, list[int]]):
+    ds = dict_split(dict_join(dj_input))
     assert list(ds['a']) == [1, 2, 3]
     assert list(ds['b']) == [4, 5, 6]
 
 
+def test_dict_split_empty():
+    assert dict_split(iter([{}])) == {}
+
+
+def test_dict_split_infinite():
+    ds = dict_split({'a': i, 'b': -i} for i in count())
+    assert take(3, ds['b']) == [0, -1, -2]
+    assert take(2, ds['a']) == [0, 1]
+
+
 def test_unzip():
     zipped = zip((1, 2, 3), ('a', 'b', 'c'))
     z1, z2 = unzip(zipped)
     assert list(z1) == [1, 2, 3]
     assert list(z2) == ['a', 'b', 'c']
+
+
+def test_unzip_n():
+    z1, z2 = unzip(((i, -i, 'x') for i in count()), 2)
+    assert take(3, z2) == [0, -1, -2]
+    assert take(3, z1) == [0, 1, 2]